@@ -0,0 +1,31 @@
+"""
+Ahead-of-time compiles the vectorized environment kernels with Numba.
+
+Run ``python compile_kernels.py`` once after installing the dependencies (and
+again whenever ``_py_step`` or ``_py_obs`` in environment.py change). It
+writes the ``flenv_kernel`` extension module (.so / .pyd) next to this file;
+environment.py imports it in preference to JIT-compiling the kernels, so
+training starts without any compilation delay.
+"""
+import os
+
+from numba.pycc import CC
+
+from environment import _py_step, _py_obs
+
+cc = CC("flenv_kernel")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Signatures must match the array dtypes allocated by VectorFluidHorizonEnv
+cc.export(
+    "step",
+    "void(f4[:], f4[:], i8[:], f4[:, :], f4[:, :], b1[:, :], i8[:], b1[:, :], f8[:], b1[:])",
+)(_py_step)
+cc.export(
+    "obs",
+    "void(f4[:], f4[:], f4[:, :], f4[:, :], f4[:, :])",
+)(_py_obs)
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Compiled kernels written to {cc.output_dir}")
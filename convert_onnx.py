@@ -1,5 +1,7 @@
 import torch
 import torch.onnx
+import onnxruntime as ort
+from onnxruntime.quantization import quantize_dynamic, QuantType
 from stable_baselines3 import PPO
 
 # 안정적인 Export용 래퍼
@@ -27,13 +29,15 @@ def convert_model(model_path, onnx_path):
     # 더미 입력 (배치 1, obs_dim = 환경 관측 공간 크기)
     dummy_input = torch.randn(1, model.observation_space.shape[0], dtype=torch.float32)
 
-    # ONNX Export
+    # ONNX Export (TorchScript 기반 exporter 고정: opset 17을 그대로 출력하고
+    # 외부 .data 파일 없이 단일 파일로 저장)
     torch.onnx.export(
         policy,
         dummy_input,
         onnx_path,
+        dynamo=False,
         export_params=True,
-        opset_version=11,
+        opset_version=17,
         do_constant_folding=True,
         input_names=['observation'],         # ✅ 웹 코드와 동일
         output_names=['action'],             # ✅ 웹에서 참조할 출력 이름
@@ -44,5 +48,18 @@ def convert_model(model_path, onnx_path):
     )
     print(f"ONNX model exported to {onnx_path}")
 
+    # ONNX Runtime 그래프 최적화 결과를 한 번 저장해 로드 시 재사용
+    opt_path = onnx_path.replace(".onnx", ".opt.onnx")
+    so = ort.SessionOptions()
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    so.optimized_model_filepath = opt_path
+    ort.InferenceSession(onnx_path, sess_options=so, providers=["CPUExecutionProvider"])
+    print(f"Optimized ONNX model saved to {opt_path}")
+
+    # INT8 동적 양자화 (웹 배포용, FP32 모델은 폴백으로 유지)
+    int8_path = onnx_path.replace(".onnx", ".int8.onnx")
+    quantize_dynamic(onnx_path, int8_path, weight_type=QuantType.QInt8)
+    print(f"INT8 quantized model exported to {int8_path}")
+
 if __name__ == "__main__":
     convert_model("final_model.zip", "model.onnx")
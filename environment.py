@@ -1,16 +1,17 @@
 import pygame
 import random
+import collections
 import math
 import sys
 import gymnasium as gym
 from gymnasium import spaces
+from gymnasium.vector.utils import batch_space
 import numpy as np
 
-# ----------------------
-# Initialization
-# ----------------------
-pygame.init()
-pygame.font.init()
+try:
+    import numba
+except ImportError:
+    numba = None
 
 # Screen dimensions
 WIDTH, HEIGHT = 800, 600
@@ -22,10 +23,6 @@ OBSTACLE_COLOR = (255, 107, 107)
 PARTICLE_COLOR = (78, 205, 196)
 TEXT_COLOR = (50, 50, 50)
 
-# Fonts
-FONT = pygame.font.SysFont("Arial", 36)
-SMALL_FONT = pygame.font.SysFont("Arial", 24)
-
 # ----------------------
 # Game constants
 # ----------------------
@@ -36,59 +33,85 @@ OBSTACLE_SPEED = 5
 OBSTACLE_INTERVAL = 1500
 OBSTACLE_WIDTH = 40
 GAP_HEIGHT = 300
+NUM_OBSTACLES = 5
+SHIP_X = 100
+SHIP_WIDTH = 40
+SHIP_HEIGHT = 30
+# Velocity normalization factor for observations
+INV_THRUST_15 = 1.0 / abs(THRUST * 1.5)
+
+# ----------------------
+# Rendering Helpers
+# ----------------------
+def _no_render():
+    pass
+
+# Pre-filled sprites, blitted instead of issuing draw.rect calls every frame
+_SHIP_SURF = pygame.Surface((SHIP_WIDTH, SHIP_HEIGHT))
+_SHIP_SURF.fill(SHIP_COLOR)
+_OBST_COL = pygame.Surface((OBSTACLE_WIDTH, HEIGHT))
+_OBST_COL.fill(OBSTACLE_COLOR)
 
 # ----------------------
 # Game Classes
 # ----------------------
 class Ship:
     def __init__(self):
-        self.width = 40
-        self.height = 30
-        self.x = 100
+        self.width = SHIP_WIDTH
+        self.height = SHIP_HEIGHT
+        self.x = SHIP_X
         self.color = SHIP_COLOR
         self.reset()
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
 
     def reset(self):
         # 중앙 대신 랜덤 y 위치에서 시작
         self.y = random.randint(HEIGHT // 4, 3 * HEIGHT // 4)
         self.velocity = 0
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
 
     def update(self, thrust_on):
         if thrust_on:
             self.velocity = THRUST
         self.velocity += GRAVITY
         self.y += self.velocity
-        self.rect.y = max(0, min(self.y, HEIGHT - self.height))
 
     def draw(self, surface):
-        pygame.draw.rect(surface, self.color, self.rect)
+        y = max(0, min(self.y, HEIGHT - self.height))
+        surface.blit(_SHIP_SURF, (self.x, y))
 
 class Obstacle:
-    def __init__(self, x):
-        self.x = x
+    def __init__(self, x, gap_center_y=None):
         self.width = OBSTACLE_WIDTH
         self.gap_height = GAP_HEIGHT
-        self.gap_center_y = random.randint(self.gap_height // 2, HEIGHT - self.gap_height // 2)
-        self.top_rect = pygame.Rect(self.x, 0, self.width, self.gap_center_y - self.gap_height // 2)
-        self.bottom_rect = pygame.Rect(self.x, self.gap_center_y + self.gap_height // 2, self.width, HEIGHT)
+        self.reset(x, gap_center_y)
+
+    def reset(self, x, gap_center_y=None):
+        # 화면 밖으로 나간 장애물을 새 위치로 재활용
+        self.x = x
+        if gap_center_y is None:
+            gap_center_y = random.randint(self.gap_height // 2, HEIGHT - self.gap_height // 2)
+        self.gap_center_y = gap_center_y
+        self.top_h = self.gap_center_y - self.gap_height // 2
+        self.bot_y = self.gap_center_y + self.gap_height // 2
         self.passed = False
 
     def update(self):
         self.x -= OBSTACLE_SPEED
-        self.top_rect.x = self.x
-        self.bottom_rect.x = self.x
 
     def draw(self, surface):
-        pygame.draw.rect(surface, OBSTACLE_COLOR, self.top_rect)
-        pygame.draw.rect(surface, OBSTACLE_COLOR, self.bottom_rect)
+        surface.blit(_OBST_COL, (self.x, 0), area=(0, 0, self.width, self.top_h))
+        surface.blit(_OBST_COL, (self.x, self.bot_y), area=(0, 0, self.width, HEIGHT - self.bot_y))
 
 def check_collision(ship, obstacles):
-    if ship.rect.top <= 0 or ship.rect.bottom >= HEIGHT:
+    ship_top = ship.y
+    ship_bottom = ship_top + ship.height
+    if ship_top <= 0 or ship_bottom >= HEIGHT:
         return True
+    ship_left = ship.x
+    ship_right = ship_left + ship.width
     for obs in obstacles:
-        if ship.rect.colliderect(obs.top_rect) or ship.rect.colliderect(obs.bottom_rect):
+        # x 범위가 겹치지 않는 장애물은 y 비교 없이 건너뜀
+        if (obs.x < ship_right and obs.x + obs.width > ship_left
+                and (ship_top < obs.top_h or ship_bottom > obs.bot_y)):
             return True
     return False
 
@@ -103,6 +126,8 @@ class FluidHorizonEnv(gym.Env):
         self.render_mode = render_mode
         self.screen = None
         self.clock = None
+        # 렌더 모드 분기를 한 번만 평가 (헤드리스 모드는 no-op)
+        self._render = self._render_human if render_mode == "human" else _no_render
 
         self.observation_space = spaces.Box(
             low=np.array([-1.0, -1.0, -1.0, -1.0, -1.0], dtype=np.float32),
@@ -112,9 +137,13 @@ class FluidHorizonEnv(gym.Env):
         self.action_space = spaces.Discrete(2)
 
         self.ship = None
-        self.obstacles = []
+        # Exactly NUM_OBSTACLES obstacles are live; step() recycles them in place
+        self.obstacles = collections.deque(maxlen=NUM_OBSTACLES)
         self.score = 0
         self.passed_obstacles = 0
+        # Scratch buffer filled in place by _get_obs; a copy is returned because
+        # SB3 vec envs keep the terminal observation across the following reset.
+        self._obs_buf = np.empty(5, dtype=np.float32)
 
     def _get_obs(self):
         next_obstacle = None
@@ -132,17 +161,13 @@ class FluidHorizonEnv(gym.Env):
             obs_gap_y = (next_obstacle.gap_center_y - (HEIGHT // 2)) / (HEIGHT // 2)
             obs_gap_h = next_obstacle.gap_height / HEIGHT
 
-        normalized_velocity = self.ship.velocity / abs(THRUST * 1.5) if abs(THRUST) > 0 else 0
-
-        obs = np.array([
-            (self.ship.y - (HEIGHT // 2)) / (HEIGHT // 2),
-            normalized_velocity,
-            rel_obs_x,
-            obs_gap_y,
-            obs_gap_h
-        ], dtype=np.float32)
-
-        return obs
+        b = self._obs_buf
+        b[0] = (self.ship.y - (HEIGHT // 2)) / (HEIGHT // 2)
+        b[1] = self.ship.velocity * INV_THRUST_15
+        b[2] = rel_obs_x
+        b[3] = obs_gap_y
+        b[4] = obs_gap_h
+        return b.copy()
 
     def _get_info(self):
         return {"score": self.score, "passed_obstacles": self.passed_obstacles}
@@ -151,14 +176,13 @@ class FluidHorizonEnv(gym.Env):
         super().reset(seed=seed)
 
         self.ship = Ship()
-        self.obstacles = []
+        self.obstacles.clear()
 
         # 첫 번째 장애물 중앙 근처 생성
-        self.obstacles.append(Obstacle(WIDTH))
-        self.obstacles[0].gap_center_y = HEIGHT // 2
+        self.obstacles.append(Obstacle(WIDTH, gap_center_y=HEIGHT // 2))
 
         # 나머지 장애물 랜덤 생성
-        for i in range(1, 5):
+        for i in range(1, NUM_OBSTACLES):
             self.obstacles.append(Obstacle(WIDTH + i * (WIDTH // 2)))
 
         self.score = 0
@@ -166,8 +190,7 @@ class FluidHorizonEnv(gym.Env):
 
         observation = self._get_obs()
         info = self._get_info()
-        if self.render_mode == "human":
-            self.render()
+        self._render()
         return observation, info
 
     def step(self, action):
@@ -176,7 +199,7 @@ class FluidHorizonEnv(gym.Env):
 
         self.ship.update(action == 1)
 
-        for obs in self.obstacles[:]:
+        for obs in self.obstacles:
             obs.update()
             if obs.x + obs.width < self.ship.x and not obs.passed:
                 obs.passed = True
@@ -186,9 +209,10 @@ class FluidHorizonEnv(gym.Env):
                 if self.score % 5 == 0:
                     reward += 15.0
 
-        if self.obstacles and self.obstacles[0].x + self.obstacles[0].width < 0:
-            self.obstacles.pop(0)
-            self.obstacles.append(Obstacle(self.obstacles[-1].x + WIDTH // 2))
+        head = self.obstacles[0]
+        if head.x + head.width < 0:
+            head.reset(self.obstacles[-1].x + WIDTH // 2)
+            self.obstacles.rotate(-1)
 
         if check_collision(self.ship, self.obstacles):
             reward = -100.0
@@ -200,36 +224,323 @@ class FluidHorizonEnv(gym.Env):
         info = self._get_info()
         truncated = False
 
-        if self.render_mode == "human":
-            self.render()
+        self._render()
 
         return observation, reward, terminated, truncated, info
 
     def render(self):
-        if self.screen is None:
-            if self.render_mode == "human":
-                pygame.init()
-                self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-                pygame.display.set_caption("Fluid Horizon RL")
-                self.clock = pygame.time.Clock()
+        self._render()
 
-        if self.render_mode == "human":
-            self.screen.fill(BG_COLOR)
-            self.ship.draw(self.screen)
-            for obs in self.obstacles:
-                obs.draw(self.screen)
+    def _render_human(self):
+        if self.screen is None:
+            # pygame과 폰트는 첫 렌더링 때만 초기화 (헤드리스 워커는 SDL을 건드리지 않음)
+            pygame.init()
+            pygame.font.init()
+            self._font = pygame.font.SysFont("Arial", 36)
+            # 점수 텍스트는 숫자 글리프를 미리 렌더링해 매 프레임 재사용
+            self._score_label = self._font.render("Score: ", True, TEXT_COLOR)
+            self._digit_surfs = [self._font.render(str(d), True, TEXT_COLOR) for d in range(10)]
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+            pygame.display.set_caption("Fluid Horizon RL")
+            self.clock = pygame.time.Clock()
+
+        self.screen.fill(BG_COLOR)
+        self.ship.draw(self.screen)
+        for obs in self.obstacles:
+            obs.draw(self.screen)
 
-            score_text = FONT.render(f"Score: {int(self.score)}", True, TEXT_COLOR)
-            self.screen.blit(score_text, (10, 10))
+        self.screen.blit(self._score_label, (10, 10))
+        x = 10 + self._score_label.get_width()
+        for digit in str(int(self.score)):
+            digit_surf = self._digit_surfs[int(digit)]
+            self.screen.blit(digit_surf, (x, 10))
+            x += digit_surf.get_width()
 
-            pygame.display.flip()
-            self.clock.tick(self.metadata["render_fps"])
+        pygame.display.flip()
+        self.clock.tick(self.metadata["render_fps"])
 
     def close(self):
         if self.screen is not None:
             pygame.quit()
             self.screen = None
 
+# ----------------------
+# Compiled Step Kernels
+# ----------------------
+def _py_step(ship_y, ship_vel, actions, obstacle_x, gap_center, passed, score,
+             recycled, rewards, terminated):
+    """
+    Advances every row of the vectorized game state by one frame in place.
+
+    Written as explicit scalar loops so Numba can compile it to native code.
+    Obstacles that left the screen are moved behind the last one and flagged
+    in ``recycled``; the caller draws their new gap centres so every backend
+    consumes the env's RNG the same way as the numpy path.
+    """
+    n_envs, n_obstacles = obstacle_x.shape
+    for i in range(n_envs):
+        # Ship physics, in float32 like the numpy path
+        vel = ship_vel[i]
+        if actions[i] == 1:
+            vel = np.float32(THRUST)
+        vel += np.float32(GRAVITY)
+        y = min(max(ship_y[i] + vel, np.float32(0)), np.float32(HEIGHT - SHIP_HEIGHT))
+        ship_vel[i] = vel
+        ship_y[i] = y
+
+        # Obstacle movement and scoring
+        reward = 0.0
+        last_x = obstacle_x[i, 0] - OBSTACLE_SPEED
+        for k in range(n_obstacles):
+            x = obstacle_x[i, k] - OBSTACLE_SPEED
+            obstacle_x[i, k] = x
+            last_x = max(last_x, x)
+            if not passed[i, k] and x + OBSTACLE_WIDTH < SHIP_X:
+                passed[i, k] = True
+                score[i] += 1
+                reward += 10.0
+                if score[i] % 5 == 0:
+                    reward += 15.0
+
+        # Recycle the obstacle that left the screen and test collisions
+        hit = y <= 0 or y + SHIP_HEIGHT >= HEIGHT
+        for k in range(n_obstacles):
+            x = obstacle_x[i, k]
+            recycled[i, k] = x + OBSTACLE_WIDTH < 0
+            if recycled[i, k]:
+                # Respawned far to the right, so it cannot overlap the ship
+                obstacle_x[i, k] = last_x + WIDTH // 2
+                passed[i, k] = False
+                continue
+            gap = gap_center[i, k]
+            if (x < SHIP_X + SHIP_WIDTH and x + OBSTACLE_WIDTH > SHIP_X
+                    and (y < gap - GAP_HEIGHT // 2 or y + SHIP_HEIGHT > gap + GAP_HEIGHT // 2)):
+                hit = True
+
+        terminated[i] = hit
+        rewards[i] = -100.0 if hit else reward + 1.0
+
+def _py_obs(ship_y, ship_vel, obstacle_x, gap_center, obs):
+    """Writes the observation of every row of the vectorized game state into ``obs``."""
+    n_envs, n_obstacles = obstacle_x.shape
+    for i in range(n_envs):
+        next_k = -1
+        for k in range(n_obstacles):
+            x = obstacle_x[i, k]
+            if x + OBSTACLE_WIDTH > SHIP_X and (next_k < 0 or x < obstacle_x[i, next_k]):
+                next_k = k
+
+        obs[i, 0] = (ship_y[i] - (HEIGHT // 2)) / (HEIGHT // 2)
+        obs[i, 1] = ship_vel[i] * INV_THRUST_15
+        if next_k < 0:
+            obs[i, 2] = 1.0
+            obs[i, 3] = 0.0
+            obs[i, 4] = 0.0
+        else:
+            obs[i, 2] = (obstacle_x[i, next_k] - SHIP_X) / WIDTH
+            obs[i, 3] = (gap_center[i, next_k] - (HEIGHT // 2)) / (HEIGHT // 2)
+            obs[i, 4] = GAP_HEIGHT / HEIGHT
+
+# Prefer the kernels AOT-compiled by compile_kernels.py, then Numba's JIT.
+# Without either the vectorized env falls back to plain numpy array operations.
+try:
+    from flenv_kernel import step as _step_kernel, obs as _obs_kernel
+except ImportError:
+    if numba is not None:
+        _step_kernel = numba.njit(cache=True, fastmath=True)(_py_step)
+        _obs_kernel = numba.njit(cache=True, fastmath=True)(_py_obs)
+    else:
+        _step_kernel = None
+        _obs_kernel = None
+
+# ----------------------
+# Vectorized Environment
+# ----------------------
+class VectorFluidHorizonEnv(gym.vector.VectorEnv):
+    """
+    Runs ``num_envs`` headless Fluid Horizon games in lock-step.
+
+    The game state is stored as numpy arrays with one row per game, so a
+    single ``step`` advances every game with array operations instead of
+    per-env Python objects. Games that crash are reset in place and the
+    observation returned for them is the first one of the new episode
+    (Gymnasium's same-step autoreset): ``info["final_obs"]`` and
+    ``info["final_info"]`` hold the state and scores at the crash, masked
+    by ``info["_final_obs"]`` / ``info["_final_info"]``. When Numba is
+    installed (or compile_kernels.py has been run) the per-frame update runs
+    in compiled kernels.
+
+    Observations are written into one preallocated C-contiguous float32
+    array of shape ``(num_envs, 5)`` that is returned by every ``reset`` and
+    ``step``, so the whole batch can go to the policy in a single forward
+    pass without stacking. The array is overwritten by the next call; copy
+    it if it has to be kept.
+    """
+    metadata = {"render_modes": [], "autoreset_mode": gym.vector.AutoresetMode.SAME_STEP}
+
+    def __init__(self, num_envs=8, seed=None):
+        self.num_envs = num_envs
+        self.render_mode = None
+        self.closed = False
+
+        self.single_observation_space = spaces.Box(
+            low=-1.0, high=1.0, shape=(5,), dtype=np.float32
+        )
+        self.single_action_space = spaces.Discrete(2)
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+        self.action_space = batch_space(self.single_action_space, num_envs)
+
+        self._rng = np.random.default_rng(seed)
+        self._rows = np.arange(num_envs)
+        self._spawn_x = np.array(
+            [WIDTH + i * (WIDTH // 2) for i in range(NUM_OBSTACLES)], dtype=np.float32
+        )
+
+        self.ship_y = np.zeros(num_envs, dtype=np.float32)
+        self.ship_vel = np.zeros(num_envs, dtype=np.float32)
+        self.obstacle_x = np.zeros((num_envs, NUM_OBSTACLES), dtype=np.float32)
+        self.gap_center = np.zeros((num_envs, NUM_OBSTACLES), dtype=np.float32)
+        self.passed = np.zeros((num_envs, NUM_OBSTACLES), dtype=bool)
+        self._recycled = np.zeros((num_envs, NUM_OBSTACLES), dtype=bool)
+        self.score = np.zeros(num_envs, dtype=np.int64)
+        self._obs_buf = np.zeros((num_envs, 5), dtype=np.float32)
+        assert self._obs_buf.flags.c_contiguous
+
+    def _random_gaps(self, size):
+        return self._rng.integers(
+            GAP_HEIGHT // 2, HEIGHT - GAP_HEIGHT // 2, size=size, endpoint=True
+        )
+
+    def _reset_rows(self, mask):
+        n = int(np.count_nonzero(mask))
+        self.ship_y[mask] = self._rng.integers(
+            HEIGHT // 4, 3 * HEIGHT // 4, size=n, endpoint=True
+        )
+        self.ship_vel[mask] = 0.0
+        self.obstacle_x[mask] = self._spawn_x
+
+        # 첫 번째 장애물은 중앙, 나머지는 랜덤
+        gaps = self._random_gaps((n, NUM_OBSTACLES))
+        gaps[:, 0] = HEIGHT // 2
+        self.gap_center[mask] = gaps
+
+        self.passed[mask] = False
+        self.score[mask] = 0
+
+    def _get_obs(self):
+        obs = self._obs_buf
+        if _obs_kernel is not None:
+            _obs_kernel(self.ship_y, self.ship_vel, self.obstacle_x, self.gap_center, obs)
+            return obs
+
+        ahead = self.obstacle_x + OBSTACLE_WIDTH > SHIP_X
+        nearest = np.where(ahead, self.obstacle_x, np.inf).argmin(axis=1)
+        has_next = ahead[self._rows, nearest]
+        next_x = self.obstacle_x[self._rows, nearest]
+        next_gap = self.gap_center[self._rows, nearest]
+
+        obs[:, 0] = (self.ship_y - (HEIGHT // 2)) / (HEIGHT // 2)
+        obs[:, 1] = self.ship_vel * INV_THRUST_15
+        obs[:, 2] = np.where(has_next, (next_x - SHIP_X) / WIDTH, 1.0)
+        obs[:, 3] = np.where(has_next, (next_gap - (HEIGHT // 2)) / (HEIGHT // 2), 0.0)
+        obs[:, 4] = np.where(has_next, GAP_HEIGHT / HEIGHT, 0.0)
+        return obs
+
+    def _get_info(self, mask=None):
+        # Gymnasium vector info layout: batched values plus "_key" masks
+        if mask is None:
+            mask = np.ones(self.num_envs, dtype=bool)
+        return {
+            "score": self.score.copy(),
+            "_score": mask.copy(),
+            "passed_obstacles": self.score.copy(),
+            "_passed_obstacles": mask.copy(),
+        }
+
+    def reset(self, seed=None, options=None):
+        if seed is not None:
+            self._rng = np.random.default_rng(seed)
+        self._reset_rows(np.ones(self.num_envs, dtype=bool))
+        return self._get_obs(), self._get_info()
+
+    def step(self, actions):
+        if _step_kernel is None:
+            return self._step_numpy(actions)
+
+        rewards = np.empty(self.num_envs, dtype=np.float64)
+        terminated = np.empty(self.num_envs, dtype=bool)
+        _step_kernel(
+            self.ship_y, self.ship_vel, np.asarray(actions, dtype=np.int64),
+            self.obstacle_x, self.gap_center, self.passed, self.score,
+            self._recycled, rewards, terminated,
+        )
+        if self._recycled.any():
+            rows, cols = np.nonzero(self._recycled)
+            self.gap_center[rows, cols] = self._random_gaps(len(rows))
+        return self._finish_step(rewards, terminated)
+
+    def _finish_step(self, rewards, terminated):
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        if not terminated.any():
+            return self._get_obs(), rewards, terminated, truncated, self._get_info()
+
+        # Same-step autoreset: keep the crash state in final_obs/final_info
+        # before the crashed rows are reset.
+        obs = self._get_obs()
+        final_obs = np.full(self.num_envs, None, dtype=object)
+        for i in np.flatnonzero(terminated):
+            final_obs[i] = obs[i].copy()
+        final_info = self._get_info(terminated)
+
+        self._reset_rows(terminated)
+        info = self._get_info()
+        info["final_obs"] = final_obs
+        info["_final_obs"] = terminated.copy()
+        info["final_info"] = final_info
+        info["_final_info"] = terminated.copy()
+        return self._get_obs(), rewards, terminated, truncated, info
+
+    def _step_numpy(self, actions):
+        actions = np.asarray(actions)
+
+        # Ship physics
+        self.ship_vel[actions == 1] = THRUST
+        self.ship_vel += GRAVITY
+        self.ship_y += self.ship_vel
+        np.clip(self.ship_y, 0, HEIGHT - SHIP_HEIGHT, out=self.ship_y)
+
+        # Obstacle movement and scoring
+        self.obstacle_x -= OBSTACLE_SPEED
+        newly_passed = ~self.passed & (self.obstacle_x + OBSTACLE_WIDTH < SHIP_X)
+        self.passed |= newly_passed
+        n_passed = newly_passed.sum(axis=1)
+        self.score += n_passed
+        rewards = 10.0 * n_passed + 15.0 * ((n_passed > 0) & (self.score % 5 == 0))
+
+        # Recycle obstacles that left the screen behind the last one
+        off_screen = self.obstacle_x + OBSTACLE_WIDTH < 0
+        if off_screen.any():
+            rows, cols = np.nonzero(off_screen)
+            self.obstacle_x[rows, cols] = self.obstacle_x[rows].max(axis=1) + WIDTH // 2
+            self.gap_center[rows, cols] = self._random_gaps(len(rows))
+            self.passed[rows, cols] = False
+
+        # AABB collision against the screen bounds and every obstacle
+        ship_y = self.ship_y[:, None]
+        overlap_x = (self.obstacle_x < SHIP_X + SHIP_WIDTH) & (
+            self.obstacle_x + OBSTACLE_WIDTH > SHIP_X
+        )
+        overlap_y = (ship_y < self.gap_center - GAP_HEIGHT // 2) | (
+            ship_y + SHIP_HEIGHT > self.gap_center + GAP_HEIGHT // 2
+        )
+        terminated = (
+            (self.ship_y <= 0)
+            | (self.ship_y + SHIP_HEIGHT >= HEIGHT)
+            | np.any(overlap_x & overlap_y, axis=1)
+        )
+        rewards = np.where(terminated, -100.0, rewards + 1.0)
+        return self._finish_step(rewards, terminated)
+
 # ----------------------
 # Main execution for testing
 # ----------------------
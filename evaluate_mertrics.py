@@ -1,15 +1,15 @@
 # evaluate_metrics.py
 import numpy as np
-from stable_baselines3 import PPO
 from environment import FluidHorizonEnv
+from onnx_policy import OnnxPolicy
 
-def evaluate_model(model_path="final_model.zip", num_episodes=10, max_steps=5000):
+def evaluate_model(model_path="model.onnx", num_episodes=10, max_steps=5000):
     """
-    Evaluate a trained PPO model on the FluidHorizonEnv.
+    Evaluate a trained PPO model, exported to ONNX, on the FluidHorizonEnv.
     Metrics: average reward, average survival time.
     """
     # 모델 불러오기
-    model = PPO.load(model_path)
+    policy = OnnxPolicy(model_path)
     env = FluidHorizonEnv(render_mode=None)
 
     rewards, survival_times = [], []
@@ -21,7 +21,7 @@ def evaluate_model(model_path="final_model.zip", num_episodes=10, max_steps=5000
 
         while not done and steps < max_steps:
             # 결정적 행동 선택 (재현성 보장)
-            action, _ = model.predict(obs, deterministic=True)
+            action = policy.predict(obs)
             obs, reward, terminated, truncated, info = env.step(action)
 
             total_reward += reward
@@ -45,4 +45,4 @@ def evaluate_model(model_path="final_model.zip", num_episodes=10, max_steps=5000
     return avg_reward, avg_survival
 
 if __name__ == "__main__":
-    evaluate_model("final_model.zip", num_episodes=10, max_steps=5000)
+    evaluate_model("model.onnx", num_episodes=10, max_steps=5000)
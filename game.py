@@ -3,16 +3,8 @@ import random
 import math
 import sys
 
-# ----------------------
-# Initialization
-# ----------------------
-pygame.init()
-pygame.font.init()
-
 # Screen dimensions
 WIDTH, HEIGHT = 800, 600
-WIN = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Fluid Horizon")
 
 # Colors
 BG_COLOR = (240, 244, 248)       # Soft pastel background
@@ -21,10 +13,6 @@ OBSTACLE_COLOR = (255, 107, 107) # Vibrant accent for obstacles
 PARTICLE_COLOR = (78, 205, 196)
 TEXT_COLOR = (50, 50, 50)
 
-# Fonts
-FONT = pygame.font.SysFont("Arial", 36)
-SMALL_FONT = pygame.font.SysFont("Arial", 24)
-
 # Game constants
 FPS = 60
 GRAVITY = 0.5
@@ -201,4 +189,17 @@ def main():
     sys.exit()
 
 if __name__ == "__main__":
+    # ----------------------
+    # Initialization
+    # ----------------------
+    pygame.init()
+    pygame.font.init()
+
+    WIN = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Fluid Horizon")
+
+    # Fonts
+    FONT = pygame.font.SysFont("Arial", 36)
+    SMALL_FONT = pygame.font.SysFont("Arial", 24)
+
     main()
@@ -0,0 +1,47 @@
+import os
+import numpy as np
+import onnxruntime as ort
+
+class OnnxPolicy:
+    """
+    Runs the policy exported by convert_onnx.py with ONNX Runtime.
+
+    Used in place of PPO.predict in the evaluation loops: the session is
+    created once (from the pre-optimized .opt.onnx graph when available) and
+    its input and output are bound to persistent numpy buffers, so every call
+    only copies the observation in and runs the graph without allocating new
+    tensors.
+    """
+    def __init__(self, onnx_path="model.onnx"):
+        so = ort.SessionOptions()
+        so.enable_mem_pattern = True
+
+        # convert_onnx.py saves the ORT-optimized graph next to the model;
+        # load it when it is up to date so graph optimization is not redone.
+        opt_path = onnx_path.replace(".onnx", ".opt.onnx")
+        if os.path.isfile(opt_path) and os.path.getmtime(opt_path) >= os.path.getmtime(onnx_path):
+            onnx_path = opt_path
+            so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+        self.model_path = onnx_path
+
+        self.session = ort.InferenceSession(
+            onnx_path, sess_options=so, providers=["CPUExecutionProvider"]
+        )
+        obs_dim = self.session.get_inputs()[0].shape[1]
+        n_actions = self.session.get_outputs()[0].shape[1]
+        self._input = np.zeros((1, obs_dim), dtype=np.float32)
+        self._output = np.zeros((1, n_actions), dtype=np.float32)
+
+        self._binding = self.session.io_binding()
+        self._binding.bind_input(
+            "observation", "cpu", 0, np.float32, self._input.shape, self._input.ctypes.data
+        )
+        self._binding.bind_output(
+            "action", "cpu", 0, np.float32, self._output.shape, self._output.ctypes.data
+        )
+
+    def predict(self, obs):
+        # 결정적 행동 선택: 가장 큰 로짓의 행동
+        np.copyto(self._input[0], obs)
+        self.session.run_with_iobinding(self._binding)
+        return int(self._output.argmax())
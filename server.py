@@ -1,12 +1,80 @@
+import gzip
+import io
+import os
+from http import HTTPStatus
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 
+def accepts_gzip(accept_encoding):
+    """Returns True if an Accept-Encoding header allows gzip (q > 0)."""
+    qualities = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding.strip().lower()] = q
+    # An explicit gzip entry takes precedence over the "*" wildcard
+    return qualities.get('gzip', qualities.get('*', 0.0)) > 0
+
 class CORSMiddleware(SimpleHTTPRequestHandler):
+    # Compressed .onnx payloads keyed by file path, reused while the mtime matches
+    gzip_cache = {}
+
     def end_headers(self):
         # Add Cross-Origin Isolation headers
         self.send_header('Cross-Origin-Opener-Policy', 'same-origin')
         self.send_header('Cross-Origin-Embedder-Policy', 'require-corp')
         super().end_headers()
 
+    def send_head(self):
+        # ONNX models are served gzip-compressed when the client accepts it and
+        # always revalidated, since convert_onnx.py rewrites them in place.
+        # Shared by GET and HEAD so both report the same headers.
+        path = self.translate_path(self.path)
+        if not (path.endswith('.onnx') and os.path.isfile(path)):
+            return super().send_head()
+
+        st = os.stat(path)
+        use_gzip = accepts_gzip(self.headers.get('Accept-Encoding', ''))
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}{"-gzip" if use_gzip else ""}"'
+
+        if_none_match = self.headers.get('If-None-Match', '')
+        if etag in (tag.strip() for tag in if_none_match.split(',')):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return None
+
+        if use_gzip:
+            cached = self.gzip_cache.get(path)
+            if cached is None or cached[0] != st.st_mtime_ns:
+                with open(path, 'rb') as f:
+                    cached = (st.st_mtime_ns, gzip.compress(f.read(), compresslevel=6))
+                self.gzip_cache[path] = cached
+            body = cached[1]
+        else:
+            with open(path, 'rb') as f:
+                body = f.read()
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', self.guess_type(path))
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Last-Modified', self.date_time_string(st.st_mtime))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        return io.BytesIO(body)
+
 # Run the server
 if __name__ == "__main__":
     PORT = 8000
@@ -1,27 +1,27 @@
 import gymnasium as gym
-from stable_baselines3 import PPO
 import os
 
 # Import the custom environment from your local file
 from environment import FluidHorizonEnv
+from onnx_policy import OnnxPolicy
 
 def evaluate_model(model_path, num_episodes=10):
     """
-    Loads a trained PPO model and evaluates its performance
+    Loads a trained PPO model, exported to ONNX, and evaluates its performance
     by rendering the environment visually.
 
     Args:
-        model_path (str): The path to the trained model file (e.g., 'final_model.zip').
+        model_path (str): The path to the exported model file (e.g., 'model.onnx').
         num_episodes (int): The number of episodes to run for evaluation.
     """
-    try:
-        # Load the trained model
-        model = PPO.load(model_path)
-        print(f"✅ Successfully loaded model from {model_path}")
-    except FileNotFoundError:
+    if not os.path.exists(model_path):
         print(f"❌ Error: Model file not found at {model_path}. Please make sure it exists.")
         return
 
+    # Load the trained model
+    policy = OnnxPolicy(model_path)
+    print(f"✅ Successfully loaded model from {model_path}")
+
     # Create the environment with render_mode='human' to show the game window
     env = FluidHorizonEnv(render_mode="human")
 
@@ -33,8 +33,8 @@ def evaluate_model(model_path, num_episodes=10):
         
         while not done:
             # Use the model to predict the next action
-            # deterministic=True ensures the agent's actions are consistent
-            action, _states = model.predict(obs, deterministic=True)
+            # The highest logit is taken, so the agent's actions are consistent
+            action = policy.predict(obs)
             
             # Take the step in the environment
             obs, reward, terminated, truncated, info = env.step(action)
@@ -48,5 +48,5 @@ def evaluate_model(model_path, num_episodes=10):
 
 if __name__ == "__main__":
     # Path to the trained model file
-    MODEL_PATH = "final_model.zip"
+    MODEL_PATH = "model.onnx"
     evaluate_model(MODEL_PATH)
@@ -1,65 +1,202 @@
 import os
 import glob
+import argparse
+import numpy as np
+import torch
 from stable_baselines3 import PPO
 from stable_baselines3.common.callbacks import CheckpointCallback
-from stable_baselines3.common.monitor import Monitor
 from stable_baselines3.common.utils import get_latest_run_id
 from stable_baselines3.common.env_util import make_vec_env
-from stable_baselines3.common.vec_env import DummyVecEnv
+from stable_baselines3.common.vec_env import SubprocVecEnv, VecEnv, VecMonitor
 
-# Import the custom environment class from the provided file
-from environment import FluidHorizonEnv
+# Import the custom environment classes from the provided file
+from environment import FluidHorizonEnv, VectorFluidHorizonEnv
 
 # --- Configuration ---
 # Set the total number of timesteps for the training
 TIMESTEPS = 1_000_000
+# Number of transitions collected per PPO update, summed over all workers
+TIMESTEPS_PER_UPDATE = 2048
+# Number of environment steps between checkpoints, summed over all workers
+SAVE_FREQ = 10_000
+# Default number of parallel environment workers
+NUM_ENVS = 8
 # Define the directories for saving checkpoints and logs
 CHECKPOINT_DIR = "./checkpoints/"
 LOG_DIR = "./tensorboard_logs/"
+# File holding the path of the most recent checkpoint
+LATEST_POINTER = os.path.join(CHECKPOINT_DIR, "latest.txt")
+
+class FluidHorizonVecEnv(VecEnv):
+    """
+    Exposes VectorFluidHorizonEnv through SB3's VecEnv interface so PPO can
+    train on the batched, single-process environment.
+    """
+    def __init__(self, num_envs):
+        self.venv = VectorFluidHorizonEnv(num_envs=num_envs)
+        super().__init__(
+            num_envs,
+            self.venv.single_observation_space,
+            self.venv.single_action_space,
+        )
+        self._actions = None
+
+    def reset(self):
+        obs, _ = self.venv.reset(seed=self._seeds[0])
+        self._reset_seeds()
+        self._reset_options()
+        return obs.copy()
+
+    def step_async(self, actions):
+        self._actions = actions
+
+    def step_wait(self):
+        obs, rewards, terminated, truncated, info = self.venv.step(self._actions)
+        dones = terminated | truncated
+        infos = [{} for _ in range(self.num_envs)]
+        for i in np.flatnonzero(dones):
+            infos[i]["terminal_observation"] = info["final_obs"][i]
+            infos[i]["TimeLimit.truncated"] = bool(truncated[i] and not terminated[i])
+        # The env reuses its observation buffer, but PPO still reads the
+        # previous observation after this step, so hand out a copy.
+        return obs.copy(), rewards.astype(np.float32), dones, infos
+
+    def close(self):
+        self.venv.close()
+
+    def get_attr(self, attr_name, indices=None):
+        return [getattr(self.venv, attr_name) for _ in self._get_indices(indices)]
+
+    def set_attr(self, attr_name, value, indices=None):
+        setattr(self.venv, attr_name, value)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        method = getattr(self.venv, method_name)
+        return [method(*method_args, **method_kwargs) for _ in self._get_indices(indices)]
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False for _ in self._get_indices(indices)]
+
+class LatestCheckpointCallback(CheckpointCallback):
+    """
+    CheckpointCallback that also records the path of every checkpoint it
+    saves in LATEST_POINTER, so resuming does not have to scan the directory.
+    """
+    def _on_step(self) -> bool:
+        result = super()._on_step()
+        if self.n_calls % self.save_freq == 0:
+            # Write then rename so the pointer is never left half-written
+            tmp_path = LATEST_POINTER + ".tmp"
+            with open(tmp_path, "w") as f:
+                f.write(self._checkpoint_path(extension="zip"))
+            os.replace(tmp_path, LATEST_POINTER)
+        return result
+
+def find_latest_checkpoint():
+    """
+    Returns the path of the latest checkpoint, or None if there is none.
+    Falls back to the newest *.zip in CHECKPOINT_DIR when the pointer file
+    is missing or stale.
+    """
+    if os.path.isfile(LATEST_POINTER):
+        with open(LATEST_POINTER) as f:
+            latest = f.read().strip()
+        if os.path.isfile(latest):
+            return latest
+
+    checkpoints = glob.glob(os.path.join(CHECKPOINT_DIR, "*.zip"))
+    if not checkpoints:
+        return None
+    # Find the latest checkpoint file by sorting
+    return max(checkpoints, key=os.path.getmtime)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Train PPO on Fluid Horizon.")
+    parser.add_argument(
+        "--num-envs",
+        type=int,
+        default=NUM_ENVS,
+        help="number of environments used for rollouts",
+    )
+    parser.add_argument(
+        "--vector-env",
+        action="store_true",
+        help="step all environments in one process with VectorFluidHorizonEnv "
+             "instead of SubprocVecEnv workers",
+    )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="compile the policy forward pass with torch.compile",
+    )
+    return parser.parse_args()
 
 def main():
     """
     Trains a PPO agent on the Fluid Horizon environment, with seamless
     resuming from the latest checkpoint.
     """
+    args = parse_args()
+
     # Create the directories if they don't exist
     os.makedirs(CHECKPOINT_DIR, exist_ok=True)
     os.makedirs(LOG_DIR, exist_ok=True)
 
-    # Instantiate the environment in headless mode for faster training
-    env = FluidHorizonEnv(render_mode=None)
-    # Wrap the environment with Monitor for better logging
-    env = Monitor(env)
+    if args.vector_env:
+        # Step every game in one batched array update; VecMonitor adds the
+        # episode statistics that Monitor provides for the worker processes.
+        env = VecMonitor(FluidHorizonVecEnv(args.num_envs))
+    else:
+        # Run headless environments in parallel worker processes.
+        # make_vec_env wraps every worker in Monitor for episode logging.
+        env = make_vec_env(
+            FluidHorizonEnv,
+            n_envs=args.num_envs,
+            env_kwargs={"render_mode": None},
+            vec_env_cls=SubprocVecEnv,
+        )
+    # Keep the rollout size per update constant regardless of worker count
+    n_steps = max(TIMESTEPS_PER_UPDATE // args.num_envs, 1)
 
     # --- Policy Selection Logic ---
     # The observation space is a 1D vector (Box), so we use MlpPolicy.
     policy = "MlpPolicy"
 
     model = None
-    latest_checkpoint = None
 
     # Search for the latest checkpoint to resume from
-    checkpoints = glob.glob(os.path.join(CHECKPOINT_DIR, "*.zip"))
-    if checkpoints:
-        # Find the latest checkpoint file by sorting
-        latest_checkpoint = max(checkpoints, key=os.path.getmtime)
+    latest_checkpoint = find_latest_checkpoint()
+    if latest_checkpoint is not None:
         print(f"✅ Resuming training from existing checkpoint: {latest_checkpoint}")
         # Load the model from the checkpoint
-        model = PPO.load(latest_checkpoint, env=env, tensorboard_log=LOG_DIR, verbose=1)
+        model = PPO.load(
+            latest_checkpoint,
+            env=env,
+            n_steps=n_steps,
+            tensorboard_log=LOG_DIR,
+            verbose=1,
+        )
     else:
         print("🔍 No checkpoint found. Starting a new training run.")
         # Create a new PPO model from scratch
         model = PPO(
             policy=policy,
             env=env,
+            n_steps=n_steps,
             verbose=1,
             tensorboard_log=LOG_DIR,
         )
 
+    if args.compile:
+        # Compile only the forward pass used for action selection in rollouts.
+        # Replacing model.policy itself would prefix its state_dict keys with
+        # "_orig_mod." and break loading of saved checkpoints.
+        model.policy.forward = torch.compile(model.policy.forward)
+
     # Configure CheckpointCallback to save the model periodically
-    # The save_freq is the number of steps between saves
-    checkpoint_callback = CheckpointCallback(
-        save_freq=10000,
+    # The save_freq counts vectorized steps, so divide by the number of workers
+    checkpoint_callback = LatestCheckpointCallback(
+        save_freq=max(SAVE_FREQ // args.num_envs, 1),
         save_path=CHECKPOINT_DIR,
         name_prefix="ppo_model",
     )